@@ -0,0 +1,75 @@
+"""
+Measure import time of the package entry points, each in a fresh interpreter.
+
+    python benchmarks/import_time.py [--repeat 5] [--json]
+
+Prints the best wall time of every import and which heavy dependencies it loaded,
+run it on every release to keep track of the startup cost.
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+ENTRY_POINTS = [
+    "suiutils_py",
+    "suiutils_py.models",
+    "suiutils_py.provider",
+    "suiutils_py.read_only",
+    "suiutils_py.balance_monitor",
+    "suiutils_py.rpc_tx_data_serializer",
+    "suiutils_py.signer",
+    "suiutils_py.wallet",
+    "suiutils_py.signer_with_provider",
+]
+
+HEAVY_MODULES = ["bip_utils", "nacl", "requests"]
+
+_SNIPPET = """
+import json, sys, time
+start = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - start
+print(json.dumps({{"seconds": elapsed, "loaded": [m for m in {heavy!r} if m in sys.modules]}}))
+"""
+
+
+def measure(module: str, repeat: int) -> dict:
+    best, loaded = None, []
+    for _ in range(repeat):
+        out = subprocess.run([sys.executable, "-c", _SNIPPET.format(module=module, heavy=HEAVY_MODULES)],
+                             cwd=ROOT, capture_output=True, text=True)
+        if out.returncode != 0:
+            lines = out.stderr.strip().splitlines()
+            return {"module": module, "error": lines[-1] if lines else "exit code %d" % out.returncode}
+        res = json.loads(out.stdout)
+        if best is None or res["seconds"] < best:
+            best = res["seconds"]
+        loaded = res["loaded"]
+    return {"module": module, "seconds": best, "loaded": loaded}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--json", action="store_true", help="print results as json")
+    args = parser.parse_args()
+
+    results = [measure(module, args.repeat) for module in ENTRY_POINTS]
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    for res in results:
+        if "error" in res:
+            print("%-40s error: %s" % (res["module"], res["error"]))
+        else:
+            print("%-40s %8.2f ms   loads: %s" % (
+                res["module"], res["seconds"] * 1000, ", ".join(res["loaded"]) or "-"))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,42 @@
+import importlib
+
 __all__ =[
+    "balance_monitor",
     "models",
     "provider",
+    "read_only",
     "rpc_tx_data_serializer",
-    "signer"
-]
\ No newline at end of file
+    "signer",
+    "signer_with_provider",
+    "wallet",
+]
+
+# public classes are resolved on first access, so `import suiutils_py` stays cheap
+# and heavy dependencies (bip_utils, nacl, requests) load only with the module that needs them
+_lazy_attrs = {
+    "BalanceMonitor": "balance_monitor",
+    "MoveCallTransaction": "models",
+    "ReadOnlyError": "read_only",
+    "RpcTxDataSerializer": "rpc_tx_data_serializer",
+    "SignerWithProvider": "signer_with_provider",
+    "SuiJsonRpcProvider": "provider",
+    "SuiReadOnlyClient": "read_only",
+    "SuiWallet": "wallet",
+    "TransferObjectTransaction": "models",
+    "TransferSuiTransaction": "models",
+}
+
+
+def __getattr__(name: str):
+    if name in _lazy_attrs:
+        value = getattr(importlib.import_module("." + _lazy_attrs[name], __name__), name)
+    elif name in __all__:
+        value = importlib.import_module("." + name, __name__)
+    else:
+        raise AttributeError("module %r has no attribute %r" % (__name__, name))
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__) | set(_lazy_attrs))
@@ -0,0 +1,306 @@
+import heapq
+import itertools
+import logging
+import time
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from .provider import SuiJsonRpcProvider
+
+logger = logging.getLogger(__name__)
+
+
+class BalanceChange:
+    def __init__(self,
+                 address: str,
+                 coin_type: str,
+                 previous: Optional[int],
+                 current: Optional[int],
+                 observed_at: float):
+        self.address = address
+        self.coin_type = coin_type
+        self.previous = previous  # None if the coin type was not held before
+        self.current = current  # None if the coin type is no longer held
+        self.observed_at = observed_at
+
+    @property
+    def delta(self) -> int:
+        return (self.current or 0) - (self.previous or 0)
+
+    def __repr__(self):
+        return "BalanceChange(address=%r, coin_type=%r, previous=%r, current=%r)" % (
+            self.address, self.coin_type, self.previous, self.current)
+
+
+class _WatchedAddress:
+    def __init__(self, address: str, interval: float, deadline: Optional[float]):
+        self.address = address
+        self.interval = interval
+        self.deadline = deadline
+        self.change_score = 0.0  # moving average of "balance changed" over recent checks
+        self.balances: Optional[Dict[str, int]] = None
+        self.last_checked: Optional[float] = None
+        self.last_changed: Optional[float] = None
+        self.due = 0.0
+        self.version = 0  # renewed on every reschedule, stale heap entries are skipped
+
+
+class BalanceMonitor:
+    """
+    Poll balances of a large set of addresses with batched json rpc requests.
+
+    Every address has its own polling interval: it drops to `min_interval` when the
+    balance changes and grows by `backoff` on every unchanged check, up to `max_interval`.
+    Addresses that change often (tracked by a moving average of changes) never back off
+    all the way. Each call of `poll` sends at most `max_batches` requests of `batch_size`
+    addresses and returns the balance changes found; `run` polls at most once every
+    `min_poll_period` seconds, which bounds the request rate. Addresses whose lookup fails
+    back off like unchanged ones. Addresses watched with a `deadline`
+    are kept in their own queue and served first from that budget, so they are checked at
+    least every `deadline` seconds as long as the due deadline addresses fit in one poll;
+    the rest of the budget goes to the other addresses, most overdue first.
+
+    If `coin_type` is None all balances are fetched with `suix_getAllBalances`,
+    otherwise only that coin is fetched with `suix_getBalance`.
+    """
+
+    def __init__(self,
+                 provider: SuiJsonRpcProvider,
+                 coin_type: Optional[str] = '0x2::sui::SUI',
+                 batch_size: int = 100,
+                 max_batches: int = 1,
+                 min_interval: float = 5.0,
+                 max_interval: float = 600.0,
+                 backoff: float = 2.0,
+                 change_decay: float = 0.8,
+                 emit_initial: bool = False):
+        if batch_size <= 0 or max_batches <= 0:
+            raise ValueError("batch_size and max_batches must be positive")
+        if not 0 < min_interval <= max_interval:
+            raise ValueError("min_interval must be positive and not greater than max_interval")
+        if backoff < 1:
+            raise ValueError("backoff must not be less than 1")
+        if not 0 <= change_decay < 1:
+            raise ValueError("change_decay must be in [0, 1)")
+
+        self.provider = provider
+        self.coin_type = coin_type
+        self.batch_size = batch_size
+        self.max_batches = max_batches
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.backoff = backoff
+        self.change_decay = change_decay
+        self.emit_initial = emit_initial
+
+        self._watched: Dict[str, _WatchedAddress] = {}
+        self._queue: List[Tuple[float, int, str]] = []
+        self._deadline_queue: List[Tuple[float, int, str]] = []
+        self._versions = itertools.count(1)  # shared by all addresses, so re-watching never revives old entries
+        self._pending: List[BalanceChange] = []  # changes found by a poll that failed later on
+
+    def __len__(self):
+        return len(self._watched)
+
+    def __contains__(self, address: str):
+        return address in self._watched
+
+    def watch(self, address: str, deadline: float = None, now: float = None):
+        """Start watching `address`, it is checked on the next poll.
+        `deadline` is the max number of seconds between two checks of this address. Watching
+        an address again without a deadline keeps its current one, see `clear_deadline`."""
+        if deadline is not None and deadline <= 0:
+            raise ValueError("deadline must be positive")
+        state = self._watched.get(address)
+        if state is None:
+            state = _WatchedAddress(address, self.min_interval, deadline)
+            self._watched[address] = state
+            self._schedule(state, self._now(now))
+        elif deadline is not None:
+            state.deadline = deadline
+            due = state.due if state.last_checked is None else min(state.due, self._next_due(state))
+            self._schedule(state, due)  # moves the address to the deadline queue
+
+    def watch_many(self, addresses: List[str], deadline: float = None, now: float = None):
+        now = self._now(now)
+        for address in addresses:
+            self.watch(address, deadline=deadline, now=now)
+
+    def unwatch(self, address: str):
+        self._watched.pop(address, None)
+
+    def clear_deadline(self, address: str):
+        state = self._watched.get(address)
+        if state is not None and state.deadline is not None:
+            state.deadline = None
+            self._schedule(state, state.due)  # moves the address back to the normal queue
+
+    def get_balances(self, address: str) -> Optional[Dict[str, int]]:
+        """Last known balances of `address` by coin type, None if not checked yet."""
+        state = self._watched.get(address)
+        if state is None or state.balances is None:
+            return None
+        return dict(state.balances)
+
+    def get_interval(self, address: str) -> float:
+        return self._effective_interval(self._watched[address])
+
+    def next_due(self) -> Optional[float]:
+        """Time at which the next address becomes due, None if nothing is watched."""
+        heads = [head[0] for head in (self._peek(self._deadline_queue), self._peek(self._queue)) if head]
+        return min(heads) if heads else None
+
+    def poll(self, now: float = None) -> List[BalanceChange]:
+        """
+        Check the due addresses and return the balance changes found.
+
+        If a request fails, every address not checked yet is put back in the queue, the
+        changes already found are kept for the next call and the error is raised.
+        """
+        now = self._now(now)
+        due = self._pop_due(now, self.batch_size * self.max_batches)
+        popped_versions = [state.version for state in due]  # a checked address gets a new version
+        changes, self._pending = self._pending, []
+        for i in range(0, len(due), self.batch_size):
+            try:
+                self._check_batch(due[i:i + self.batch_size], now, changes)
+            except Exception:
+                for state, version in zip(due[i:], popped_versions[i:]):
+                    if self._watched.get(state.address) is state and state.version == version:
+                        self._schedule(state, now)
+                self._pending = changes
+                raise
+        return changes
+
+    def run(self,
+            idle_sleep: float = 1.0,
+            max_error_sleep: float = 60.0,
+            min_poll_period: float = 1.0) -> Iterator[BalanceChange]:
+        """Poll forever, yielding balance changes as they are found.
+        Polls start at least `min_poll_period` seconds apart, so at most `max_batches` requests
+        are sent per period even with a backlog. Failed polls are logged and retried with
+        exponential backoff up to `max_error_sleep`."""
+        if min_poll_period <= 0:
+            raise ValueError("min_poll_period must be positive")
+        error_sleep = idle_sleep
+        while True:
+            started = time.monotonic()
+            try:
+                changes = self.poll()
+            except Exception as e:
+                logger.warning("balance poll failed, retrying in %.1fs: %r", error_sleep, e)
+                time.sleep(max(error_sleep, min_poll_period))
+                error_sleep = min(max_error_sleep, error_sleep * 2)
+                continue
+            error_sleep = idle_sleep
+            yield from changes
+            next_due = self.next_due()
+            now = time.monotonic()
+            wait = idle_sleep if next_due is None else min(idle_sleep, max(0.0, next_due - now))
+            time.sleep(max(wait, started + min_poll_period - now))
+
+    @staticmethod
+    def _now(now: Optional[float]) -> float:
+        return time.monotonic() if now is None else now
+
+    def _schedule(self, state: _WatchedAddress, due: float):
+        state.version = next(self._versions)
+        state.due = due
+        queue = self._queue if state.deadline is None else self._deadline_queue
+        heapq.heappush(queue, (due, state.version, state.address))
+
+    def _peek(self, queue: List[Tuple[float, int, str]]) -> Optional[Tuple[float, _WatchedAddress]]:
+        while queue:
+            due, version, address = queue[0]
+            state = self._watched.get(address)
+            if state is not None and state.version == version:
+                return due, state
+            heapq.heappop(queue)
+        return None
+
+    def _pop_due(self, now: float, limit: int) -> List[_WatchedAddress]:
+        due = []
+        # deadline addresses get the budget first, then the rest by due time
+        for queue in (self._deadline_queue, self._queue):
+            while len(due) < limit:
+                head = self._peek(queue)
+                if head is None or head[0] > now:
+                    break
+                heapq.heappop(queue)
+                due.append(head[1])
+        return due
+
+    def _effective_interval(self, state: _WatchedAddress) -> float:
+        # frequently changing addresses are capped closer to min_interval
+        cap = self.max_interval - (self.max_interval - self.min_interval) * state.change_score
+        interval = min(state.interval, cap)
+        if state.deadline is not None:
+            interval = min(interval, state.deadline)
+        return interval
+
+    def _next_due(self, state: _WatchedAddress) -> float:
+        return state.last_checked + self._effective_interval(state)
+
+    def _build_request(self, address: str) -> Tuple[str, list]:
+        if self.coin_type is None:
+            return "suix_getAllBalances", [address]
+        return "suix_getBalance", [address, self.coin_type]
+
+    def _parse_balances(self, result) -> Dict[str, int]:
+        if self.coin_type is None:
+            return {item['coinType']: int(item['totalBalance']) for item in result}
+        return {result['coinType']: int(result['totalBalance'])}
+
+    def _check_batch(self, batch: List[_WatchedAddress], now: float, changes: List[BalanceChange]):
+        # changes are appended as each address is checked, so they survive an error later on
+        methods, params, request_ids = [], [], []
+        for i, state in enumerate(batch):
+            method, param = self._build_request(state.address)
+            methods.append(method)
+            params.append(param)
+            request_ids.append(str(i))
+
+        res = self.provider.batch_send_request_to_rpc(methods, params, request_ids)
+        results = {}
+        if isinstance(res, list):
+            results = {item.get('id'): item for item in res if isinstance(item, dict)}
+
+        for i, state in enumerate(batch):
+            if self._watched.get(state.address) is not state:
+                continue  # unwatched while the request was in flight
+            item = results.get(str(i))
+            try:
+                balances = self._parse_balances(item['result'])
+            except (KeyError, TypeError, ValueError):
+                self._fail(state, item, now)
+                continue
+            changes.extend(self._update(state, balances, now))
+
+    def _fail(self, state: _WatchedAddress, item: Optional[dict], now: float):
+        # failed lookups back off like unchanged checks, so bad addresses do not hog the budget
+        state.interval = min(self.max_interval, state.interval * self.backoff)
+        delay = self._effective_interval(state)
+        error = item.get('error', item) if item is not None else "missing from response"
+        logger.warning("balance lookup of %s failed, retrying in %.1fs: %r", state.address, delay, error)
+        self._schedule(state, now + delay)
+
+    def _update(self, state: _WatchedAddress, balances: Dict[str, int], now: float) -> List[BalanceChange]:
+        previous = state.balances
+        changes = []
+        if previous is not None or self.emit_initial:
+            old = previous or {}
+            for coin_type in sorted(set(old) | set(balances)):
+                if old.get(coin_type) != balances.get(coin_type):
+                    changes.append(BalanceChange(state.address, coin_type,
+                                                 old.get(coin_type), balances.get(coin_type), now))
+
+        changed = previous is not None and previous != balances
+        state.change_score = state.change_score * self.change_decay + (1 - self.change_decay if changed else 0.0)
+        if changed:
+            state.interval = self.min_interval
+            state.last_changed = now
+        elif previous is not None:
+            state.interval = min(self.max_interval, state.interval * self.backoff)
+        state.balances = balances
+        state.last_checked = now
+        self._schedule(state, self._next_due(state))
+        return changes
@@ -2,7 +2,6 @@ import uuid
 import base64
 from typing import Dict, Optional, Union
 from .signer import SignedTransactionSerializedSig
-import requests as rq
 
 
 class ExecuteTransactionRequestType:
@@ -19,6 +18,8 @@ class SuiJsonRpcProvider:
                  rpc_url: str,
                  faucet_url: str = None,
                  session_headers: Dict = None):
+        import requests as rq  # deferred until a provider is created
+
         self.session = rq.Session()
         self.session.headers.update(session_headers or {})
 
@@ -0,0 +1,47 @@
+from typing import Dict
+
+from .provider import SuiJsonRpcProvider
+
+
+class ReadOnlyError(RuntimeError):
+    pass
+
+
+class SuiReadOnlyClient(SuiJsonRpcProvider):
+    """
+    Json rpc client for services that only read chain data.
+
+    Importing this module does not load any crypto dependency (nacl, bip_utils).
+    Requesting faucet tokens and calling any method in `WRITE_METHODS`, including through
+    `send_request_to_rpc` and `batch_send_request_to_rpc`, raises `ReadOnlyError`.
+    """
+
+    # rpc methods that submit a signed transaction to the network
+    WRITE_METHODS = frozenset([
+        "sui_executeTransactionBlock",
+    ])
+
+    def __init__(self, rpc_url: str, session_headers: Dict = None):
+        super().__init__(rpc_url=rpc_url, faucet_url=None, session_headers=session_headers)
+
+    def _check_read_only(self, method: str):
+        if method in self.WRITE_METHODS:
+            raise ReadOnlyError("SuiReadOnlyClient can not call %s" % method)
+
+    def send_request_to_rpc(self,
+                            method: str,
+                            params: list = None,
+                            request_id: str = None):
+        self._check_read_only(method)
+        return super().send_request_to_rpc(method, params, request_id)
+
+    def batch_send_request_to_rpc(self,
+                                  methods: list,
+                                  params: list = None,
+                                  request_ids: list = None):
+        for method in methods:
+            self._check_read_only(method)
+        return super().batch_send_request_to_rpc(methods, params, request_ids)
+
+    def request_tokens_from_faucet(self, addr: str):
+        raise ReadOnlyError("SuiReadOnlyClient can not request tokens from faucet")
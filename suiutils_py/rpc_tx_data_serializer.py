@@ -1,4 +1,3 @@
-import requests as rq
 import uuid
 from typing import Dict
 
@@ -7,6 +6,8 @@ from .models import TransferSuiTransaction, TransferObjectTransaction, MoveCallT
 
 class RpcTxDataSerializer:
     def __init__(self, rpc_url: str, session_headers: Dict = None):
+        import requests as rq  # deferred until a serializer is created
+
         self.rpc_url = rpc_url
         self.session = rq.Session()
         self.session.headers.update(session_headers or {})
@@ -1,6 +1,5 @@
 import base64
 import hashlib
-import nacl.signing
 
 SigFlagEd25519 = 0x00
 SigFlagSecp256k1 = 0x01
@@ -10,6 +9,8 @@ class TxnMetaData:
         self.TxBytes = tx_bytes
 
     def SignSerializedSigWith(self, private_key: bytes) -> 'SignedTransactionSerializedSig':
+        import nacl.signing  # slow to import, load on first use
+
         tx_bytes = base64.b64decode(self.TxBytes)
         message = self.messageWithIntent(tx_bytes)
         digest = hashlib.blake2b(message, digest_size=32).digest()
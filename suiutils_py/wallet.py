@@ -1,8 +1,6 @@
 import base64
-import bip_utils
 import hashlib
-import nacl
-from nacl.signing import SigningKey
+
 
 class SignatureScheme:
     ED25519 = 'ED25519'
@@ -14,6 +12,8 @@ class SuiWallet:
         self.mnemonic = mnemonic
         self.derivation_path = derivation_path
 
+        import bip_utils  # slow to import, load on first use
+
         self.bip39_seed = bip_utils.Bip39SeedGenerator(self.mnemonic).Generate()  # or = bip39.phrase_to_seed(mnemonic)
         self.bip32_ctx = bip_utils.Bip32Slip10Ed25519.FromSeed(self.bip39_seed)
         self.bip32_der_ctx = self.bip32_ctx.DerivePath(derivation_path)
@@ -24,6 +24,8 @@ class SuiWallet:
 
     @staticmethod
     def create_random_wallet():
+        import bip_utils
+
         return SuiWallet(
             mnemonic=bip_utils.Bip39MnemonicGenerator().FromWordsNumber(bip_utils.Bip39WordsNum.WORDS_NUM_24).ToStr())
 
@@ -31,6 +33,8 @@ class SuiWallet:
         return "0x" + hashlib.blake2b(self.public_key, digest_size=32).hexdigest()[:64]
 
     def sign_data(self, data: bytes) -> bytes:
+        from nacl.signing import SigningKey
+
         return SigningKey(self.private_key).sign(data)[:64]  # Todo: support secp256k1 key and signature
 
     def get_public_key_as_b64_string(self) -> str:
@@ -0,0 +1,161 @@
+import pytest
+
+from suiutils_py import balance_monitor
+from suiutils_py.balance_monitor import BalanceMonitor
+
+SUI = '0x2::sui::SUI'
+
+
+class StubProvider:
+    def __init__(self, balances=None):
+        self.balances = balances or {}
+        self.batches = []
+        self.fail_on_batch = None  # raise IOError on this batch number (1 based)
+        self.bad_results = {}  # address -> response item replacing the normal one
+
+    def batch_send_request_to_rpc(self, methods, params, request_ids):
+        addresses = [param[0] for param in params]
+        self.batches.append(addresses)
+        if self.fail_on_batch == len(self.batches):
+            raise IOError("node unavailable")
+        res = []
+        for address, request_id in zip(addresses, request_ids):
+            if address in self.bad_results:
+                item = dict(self.bad_results[address], id=request_id)
+            else:
+                item = {"id": request_id,
+                        "result": {"coinType": SUI, "totalBalance": str(self.balances.get(address, 0))}}
+            res.append(item)
+        return res
+
+    def checked(self, address):
+        return sum(batch.count(address) for batch in self.batches)
+
+
+def test_unchanged_addresses_back_off_and_changes_reset_interval():
+    provider = StubProvider({"a": 1})
+    monitor = BalanceMonitor(provider, min_interval=1, max_interval=8)
+    monitor.watch("a", now=0)
+
+    assert monitor.poll(now=0) == []
+    for now in range(1, 20):
+        monitor.poll(now=now)
+    assert monitor.get_interval("a") == 8
+
+    provider.balances["a"] = 5
+    changes = []
+    for now in range(20, 40):
+        changes.extend(monitor.poll(now=now))
+    assert [(c.address, c.previous, c.current) for c in changes] == [("a", 1, 5)]
+    assert monitor.get_interval("a") < 8
+
+
+def test_deadline_addresses_are_served_first_under_load():
+    provider = StubProvider()
+    monitor = BalanceMonitor(provider, batch_size=50, max_interval=600)
+    monitor.watch_many(["addr%d" % i for i in range(5000)], now=0)
+    monitor.watch("hot", deadline=10, now=0)
+
+    checks = []
+    for now in range(300):
+        provider.batches = []
+        monitor.poll(now=now)
+        if provider.checked("hot"):
+            checks.append(now)
+    assert checks[0] == 0
+    assert max(b - a for a, b in zip(checks, checks[1:])) <= 10
+
+
+def test_watch_again_keeps_deadline_until_cleared():
+    monitor = BalanceMonitor(StubProvider())
+    monitor.watch("hot", deadline=10, now=0)
+    monitor.watch_many(["hot", "other"], now=0)
+    monitor.poll(now=0)
+    for _ in range(5):
+        monitor.poll(now=monitor.next_due())
+    assert monitor.get_interval("hot") == 10
+
+    monitor.clear_deadline("hot")
+    assert monitor.get_interval("hot") > 10
+
+
+def test_failed_batch_requeues_unchecked_addresses_and_keeps_changes():
+    provider = StubProvider()
+    monitor = BalanceMonitor(provider, batch_size=2, max_batches=3, emit_initial=True)
+    monitor.watch_many(["a%d" % i for i in range(6)], now=0)
+
+    provider.fail_on_batch = 2
+    with pytest.raises(IOError):
+        monitor.poll(now=0)
+
+    changes = monitor.poll(now=0)
+    assert sorted(c.address for c in changes) == ["a%d" % i for i in range(6)]
+    assert provider.batches[-2:] == [["a2", "a3"], ["a4", "a5"]]
+
+
+def test_malformed_item_does_not_block_the_batch():
+    provider = StubProvider({"a": 1, "b": 2, "c": 3})
+    provider.bad_results["b"] = {"result": None}
+    monitor = BalanceMonitor(provider, emit_initial=True)
+    monitor.watch_many(["a", "b", "c"], now=0)
+
+    changes = monitor.poll(now=0)
+    assert [c.address for c in changes] == ["a", "c"]
+    assert monitor.get_balances("b") is None
+    assert monitor.poll(now=1) == []
+
+
+def test_failing_address_backs_off():
+    provider = StubProvider()
+    provider.bad_results["bad"] = {"error": {"code": -32602, "message": "invalid address"}}
+    monitor = BalanceMonitor(provider, min_interval=5, max_interval=600)
+    monitor.watch("bad", now=0)
+
+    for now in range(100):
+        monitor.poll(now=now)
+    assert provider.checked("bad") <= 4
+    assert monitor.get_interval("bad") > 5
+
+
+def test_rewatch_after_unwatch_checks_address_once():
+    provider = StubProvider()
+    monitor = BalanceMonitor(provider, min_interval=5)
+    monitor.watch("x", now=0)
+    monitor.unwatch("x")
+    monitor.watch("x", now=0)
+
+    monitor.poll(now=0)
+    assert provider.batches == [["x"]]
+    assert monitor.get_interval("x") == 5
+
+
+def test_run_limits_poll_rate_with_backlog(monkeypatch):
+    clock = [0.0]
+    sleeps = []
+
+    def sleep(seconds):
+        sleeps.append(seconds)
+        clock[0] += seconds
+
+    monkeypatch.setattr(balance_monitor.time, "monotonic", lambda: clock[0])
+    monkeypatch.setattr(balance_monitor.time, "sleep", sleep)
+    provider = StubProvider()
+    monitor = BalanceMonitor(provider, batch_size=10, emit_initial=True)
+    monitor.watch_many(["a%d" % i for i in range(100)], now=0)
+
+    changes = monitor.run(min_poll_period=2.0)
+    for _ in range(50):
+        next(changes)
+    assert len(provider.batches) == 5
+    assert sleeps == [2.0] * 4
+
+
+@pytest.mark.parametrize("kwargs", [
+    {"batch_size": 0},
+    {"min_interval": 10, "max_interval": 5},
+    {"backoff": 0.5},
+    {"change_decay": 1},
+])
+def test_invalid_arguments(kwargs):
+    with pytest.raises(ValueError):
+        BalanceMonitor(StubProvider(), **kwargs)